@@ -1,18 +1,45 @@
-import pandas as pd
-from scipy import stats
-from Bio import SeqIO
+from Bio.SeqIO.FastaIO import SimpleFastaParser
 import numpy as np
-import os
+from collections import Counter
+
+from fasta_scan import (count_records, fasta_header_lengths, jit_header_lengths,
+                        preview_rows, save_csv, scan_fasta)
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-def convert(fasta_file):
+BINCOUNT_MAX_LEN = 1 << 24   # above this, mode falls back to Counter
+
+def convert(fasta_file, keep_sequences=False):
     """
-    Reads a fasta file, calculates sequence lengths, and returns a dataframe and stats.
+    Reads a fasta file, calculates sequence lengths, and returns the table
+    (a dict of columns: name -> list / int64 array) and stats.
+    Sequences are only kept with keep_sequences=True; otherwise the table holds
+    Id and Length alone (much less memory, nothing downstream needs them).
     """
 
     try:
-        records = SeqIO.parse(fasta_file, "fasta")
+        n = count_records(fasta_file)
+        ids = [None] * n
+        seq_list = [None] * n if keep_sequences else None
+        L = np.empty(n, dtype=np.int64)
+        filled = 0
+
+        if keep_sequences:
+            # newline="\n" splits lines exactly like count_records' byte search
+            with open(fasta_file, "r", newline="\n") as fh:
+                for i, (title, seq) in zip(range(n), SimpleFastaParser(fh)):
+                    ids[i] = title.split(None, 1)[0] if title else ""
+                    seq_list[i] = seq
+                    L[i] = len(seq)
+                    filled = i + 1
+        elif scan_fasta is not None:
+            filled = jit_header_lengths(fasta_file, ids, L)
+        else:
+            for i, (rec_id, length) in zip(range(n), fasta_header_lengths(fasta_file)):
+                ids[i] = rec_id
+                L[i] = length
+                filled = i + 1
     except FileNotFoundError:
         messagebox.showerror("Error", "File is not available.")
         return None, None
@@ -20,46 +47,49 @@ def convert(fasta_file):
         messagebox.showerror("Error", f"Error reading fasta file: {e}")
         return None, None
 
-    ids = []
-    sequences = []
-    lengths = []
-
-    for record in records:
-        ids.append(record.id)
-        sequences.append(str(record.seq))
-        lengths.append(len(record.seq))
-
-    if not ids:
+    if not filled:
         messagebox.showwarning("Warning", "No sequences found in FASTA file.")
         return None, None
 
-    df = pd.DataFrame({
-        'Id': ids,
-        'Sequence': sequences,
-        'Length': lengths
-    })
+    # keep only the records actually read (the file may have changed since the count)
+    data = {'Id': ids[:filled]}
+    if keep_sequences:
+        data['Sequence'] = seq_list[:filled]
+    L = L[:filled]
+    data['Length'] = L
 
     # Calculate statistics
-    mean_len = df['Length'].mean()
-    median_len = df['Length'].median()
-    mode_result = stats.mode(df['Length'], keepdims=True)
+    mean_len = float(L.mean())
+    median_len = float(np.median(L))
+    if L.max() <= BINCOUNT_MAX_LEN:
+        counts = np.bincount(L)
+        mode_len = int(counts.argmax())
+        mode_count = int(counts[mode_len])
+    else:
+        # bincount would need max(L) slots; hash-count instead (no sort)
+        mode_len, mode_count = Counter(L.tolist()).most_common(1)[0]
 
     stats_dict = {
         "mean": mean_len,
         "median": median_len,
-        "mode": mode_result.mode[0],
-        "mode_count": mode_result.count[0]
+        "mode": mode_len,
+        "mode_count": mode_count
     }
 
     # Save CSV output
-    output_filename = "project_output.csv"
-    df.to_csv(output_filename, index=False)
+    save_csv(data)
 
-    return df, stats_dict
+    return data, stats_dict
 
 
 # ---------------- GUI ---------------- #
 
+TABLE_COLUMNS = ("Id", "Sequence", "Length")
+TABLE_WINDOW = 500     # rows kept in the Treeview at any time
+
+# Treeview state: only a window of rows is inserted, refilled on scroll
+table_state = {"tree": None, "scroll": None, "rows": [], "n": 0, "start": 0, "end": 0}
+
 def browse_file():
     filename = filedialog.askopenfilename(
         title="Select FASTA File",
@@ -77,33 +107,111 @@ def process_file():
         messagebox.showwarning("Warning", "Please select a FASTA file first.")
         return
 
-    df, stats_dict = convert(fasta)
+    data, stats_dict = convert(fasta, keep_sequences=keep_seq_var.get())
 
-    if df is not None:
-        show_table(df)
+    if data is not None:
+        show_table(data)
         show_stats(stats_dict)
 
         messagebox.showinfo("Success", "Conversion complete.\nCSV saved as project_output.csv")
 
 
-def show_table(df):
-    for widget in table_frame.winfo_children():
-        widget.destroy()
+def build_table():
+    """
+    Creates the Treeview and its scrollbar once; columns never change.
+    """
+    scroll = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=on_table_scroll)
+    scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    tree = ttk.Treeview(table_frame, yscrollcommand=on_tree_scroll)
+    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    tree = ttk.Treeview(table_frame)
-    tree.pack(fill=tk.BOTH, expand=True)
+    for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        tree.bind(seq, on_table_wheel)
 
     # Define columns
-    tree["columns"] = list(df.columns)
+    tree["columns"] = TABLE_COLUMNS
     tree["show"] = "headings"
 
-    for col in df.columns:
+    for col in TABLE_COLUMNS:
         tree.heading(col, text=col)
         tree.column(col, width=200)
 
-    # Insert rows
-    for _, row in df.iterrows():
-        tree.insert("", tk.END, values=list(row))
+    table_state.update(tree=tree, scroll=scroll)
+
+
+def show_table(data):
+    table_state.update(
+        rows=preview_rows(data),
+        n=len(data["Id"]),
+    )
+    fill_table_window(0)
+    table_state["tree"].yview_moveto(0)
+
+
+def fill_table_window(start):
+    """
+    Replaces the Treeview rows with rows [start, start + TABLE_WINDOW) of the table.
+    """
+    tree = table_state["tree"]
+    end = min(start + TABLE_WINDOW, table_state["n"])
+    tree.delete(*tree.get_children())
+
+    insert = tree.insert
+    for row in table_state["rows"][start:end]:
+        insert("", tk.END, values=row)
+
+    table_state.update(start=start, end=end)
+
+
+def scroll_table_to(top):
+    """
+    Shows row `top` (index into the full table) at the top of the Treeview.
+    """
+    tree = table_state["tree"]
+    n = table_state["n"]
+    size = table_state["end"] - table_state["start"]
+    if not n or not size:
+        return
+
+    lo, hi = tree.yview()
+    visible = max(int(round((hi - lo) * size)), 1)
+    top = max(0, min(top, n - visible))
+
+    if not (table_state["start"] <= top and top + visible <= table_state["end"]):
+        fill_table_window(max(0, top - TABLE_WINDOW // 2))
+        size = table_state["end"] - table_state["start"]
+
+    tree.yview_moveto((top - table_state["start"]) / size)
+
+
+def on_tree_scroll(lo, hi):
+    # map the Treeview position inside the window onto the whole table
+    n = table_state["n"]
+    start = table_state["start"]
+    size = table_state["end"] - start
+    if not n or not size:
+        table_state["scroll"].set(0, 1)
+        return
+    table_state["scroll"].set((start + float(lo) * size) / n, (start + float(hi) * size) / n)
+
+
+def on_table_scroll(action, amount, unit=None):
+    n = table_state["n"]
+    lo, hi = table_state["scroll"].get()
+    top = int(round(lo * n))
+    if action == "moveto":
+        top = int(float(amount) * n)
+    elif unit == "pages":
+        top += int(amount) * max(int((hi - lo) * n), 1)
+    else:
+        top += int(amount)
+    scroll_table_to(top)
+
+
+def on_table_wheel(event):
+    step = -3 if (event.num == 4 or event.delta > 0) else 3
+    on_table_scroll("scroll", step, "units")
+    return "break"
 
 
 def show_stats(stats):
@@ -123,6 +231,7 @@ root.title("FASTA File Analyzer")
 root.geometry("900x600")
 
 file_path_var = tk.StringVar()
+keep_seq_var = tk.BooleanVar(value=False)
 
 # Top frame
 top_frame = tk.Frame(root)
@@ -131,10 +240,12 @@ top_frame.pack(fill=tk.X, pady=10)
 tk.Label(top_frame, text="Selected File: ").pack(side=tk.LEFT, padx=5)
 tk.Entry(top_frame, textvariable=file_path_var, width=60).pack(side=tk.LEFT)
 tk.Button(top_frame, text="Browse", command=browse_file).pack(side=tk.LEFT, padx=5)
+tk.Checkbutton(top_frame, text="Keep sequences", variable=keep_seq_var).pack(side=tk.LEFT, padx=5)
 
 # Table frame
 table_frame = tk.Frame(root, bd=2, relief=tk.SUNKEN)
 table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+build_table()
 
 # Stats display
 stats_label = tk.Label(root, font=("Courier", 10), justify=tk.LEFT)
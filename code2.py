@@ -1,12 +1,17 @@
+import os
 import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 # numeric & plotting libs
 import numpy as np
-import pandas as pd
-from Bio import SeqIO
+from Bio.SeqIO.FastaIO import SimpleFastaParser
+
+from fasta_scan import (count_records, fasta_header_lengths, jit_header_lengths,
+                        preview_rows, save_csv, scan_fasta)
 
 import matplotlib
 matplotlib.use("TkAgg")
@@ -16,72 +21,126 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # ---------------- CORE ----------------
 
-def convert(fasta_file):
-    p = Path(fasta_file)
-    
-
-    with p.open("r") as fh:
-        records = list(SeqIO.parse(fh, "fasta"))
+BINCOUNT_MAX_LEN = 1 << 24   # above this, mode falls back to Counter
 
-    
+def file_key(fasta_file):
+    """Cache key for a parsed file: changes whenever the file does."""
+    st = os.stat(fasta_file)
+    return (os.path.abspath(fasta_file), st.st_mtime_ns, st.st_size)
 
-    ids = [r.id for r in records]
-    seqs = [str(r.seq) for r in records]
-    lengths = [len(r.seq) for r in records]
 
-    df = pd.DataFrame({"Id": ids, "Sequence": seqs, "Length": lengths})
-
-    mean_len = float(df["Length"].mean())
-    median_len = float(df["Length"].median())
+def convert(fasta_file, keep_sequences=False):
+    p = Path(fasta_file)
 
-    vc = df["Length"].value_counts().sort_values(ascending=False)
-    mode_len = int(vc.index[0])
-    mode_count = int(vc.iloc[0])
+    # preallocate from a header count instead of growing lists
+    n = count_records(p)
+    ids = [None] * n
+    L = np.empty(n, dtype=np.int64)
+
+    # the table is a plain column dict (name -> list / int64 array), no DataFrame.
+    # Sequences are only kept on request: they are the bulk of the memory and
+    # nothing but the CSV (and a truncated preview) ever reads them.
+    filled = 0
+    seqs = None
+    if keep_sequences:
+        seqs = [None] * n
+        # newline="\n" splits lines exactly like count_records' byte search
+        with p.open("r", newline="\n") as fh:
+            for i, (title, seq) in zip(range(n), SimpleFastaParser(fh)):
+                ids[i] = title.split(None, 1)[0] if title else ""
+                seqs[i] = seq
+                L[i] = len(seq)
+                filled = i + 1
+    elif scan_fasta is not None:
+        # stats-only path: Sequence column is never built
+        filled = jit_header_lengths(p, ids, L)
+    else:
+        for i, (rec_id, length) in zip(range(n), fasta_header_lengths(p)):
+            ids[i] = rec_id
+            L[i] = length
+            filled = i + 1
+
+    if not filled:
+        raise ValueError("No sequences found in FASTA file.")
+
+    # the pass may see fewer records than counted (file changed in between);
+    # never let unfilled slots of np.empty reach the stats
+    if filled < n:
+        ids, L = ids[:filled], L[:filled]
+        if seqs is not None:
+            seqs = seqs[:filled]
+
+    columns = {"Id": ids}
+    if seqs is not None:
+        columns["Sequence"] = seqs
+    columns["Length"] = L
+
+    # stats straight on the int64 array (no pandas dispatch)
+    mean_len = float(L.mean())
+    median_len = float(np.median(L))
+
+    if L.max() <= BINCOUNT_MAX_LEN:
+        counts = np.bincount(L)
+        mode_len = int(counts.argmax())
+        mode_count = int(counts[mode_len])
+    else:
+        # bincount would allocate max(L) slots; hash-count instead (no sort)
+        mode_len, mode_count = Counter(L.tolist()).most_common(1)[0]
 
     stats = {
         "mean": mean_len,
         "median": median_len,
         "mode": mode_len,
         "mode_count": mode_count,
-        "vc": vc
     }
 
     try:
-        df.to_csv("project_output.csv", index=False)
+        save_csv(columns)
     except:
         pass
 
-    return df, stats
+    return columns, stats
 
 
-def make_bar_plot(stats):
-    """Create wide & readable bar chart."""
+def make_bar_plot():
+    """Create wide & readable bar chart (built once, updated in place)."""
     labels = ["Mean", "Median", "Mode"]
-    values = [stats["mean"], stats["median"], stats["mode"]]
 
     fig = Figure(figsize=(6, 4), dpi=80)  # <- WIDER plot
     ax = fig.add_subplot(1, 1, 1)
 
     x = np.arange(len(labels))
-    bars = ax.bar(x, values, edgecolor="black", linewidth=1)
+    bars = ax.bar(x, [0] * len(labels), edgecolor="black", linewidth=1)
 
     ax.set_xticks(x)
     ax.set_xticklabels(labels, fontsize=12)
     ax.set_ylabel("Length", fontsize=12)
     ax.set_title("Mean | Median | Mode", fontsize=14)
 
-    for rect, val in zip(bars, values):
-        ax.annotate(f"{val:.2f}",
-                     xy=(rect.get_x() + rect.get_width() / 2, rect.get_height()),
-                     xytext=(0, 6), textcoords="offset points",
-                     ha="center", fontsize=11, fontweight="bold")
+    annots = [
+        ax.annotate("",
+                    xy=(rect.get_x() + rect.get_width() / 2, 0),
+                    xytext=(0, 6), textcoords="offset points",
+                    ha="center", fontsize=11, fontweight="bold")
+        for rect in bars
+    ]
 
     fig.tight_layout()
-    return fig
+    return fig, ax, bars, annots
 
 
 # ---------------- GUI APP ----------------
 
+TABLE_COLUMNS = ("Id", "Sequence", "Length")
+TABLE_WINDOW = 500     # rows kept in the Treeview at any time
+CACHE_SIZE = 4         # parsed files kept in memory for re-opens
+
+
+def parse_for_table(fasta_file, keep_sequences=False):
+    """Worker-thread job: convert() plus the prepared table rows."""
+    data, stats = convert(fasta_file, keep_sequences)
+    return data, stats, preview_rows(data)
+
 class App:
     def __init__(self, root):
         self.root = root
@@ -90,6 +149,13 @@ class App:
 
         self.current_fig = None
 
+        # (path, mtime, size, keep_sequences) -> (data, stats, rows), oldest first
+        self._cache = {}
+        self._csv_key = None     # key whose CSV write last finished
+        self._csv_queued = None  # key of the last CSV write queued (single worker: runs last)
+        self._request = 0      # bumped per process(); older results are not shown
+        self._pending = 0      # parses still running (progress bar)
+
         # --- TOP BAR ---
         top = tk.Frame(root)
         top.pack(fill=tk.X, pady=10)
@@ -101,6 +167,14 @@ class App:
         tk.Button(top, text="Browse", command=self.browse).pack(side=tk.LEFT, padx=10)
         tk.Button(top, text="Download Plot", command=self.download_plot).pack(side=tk.LEFT, padx=5)
 
+        self.keep_seq_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(top, text="Keep sequences", variable=self.keep_seq_var).pack(side=tk.LEFT, padx=5)
+
+        # parsing runs on a worker thread; the bar spins while it does
+        self.progress = ttk.Progressbar(top, mode="indeterminate", length=120)
+        self.progress.pack(side=tk.LEFT, padx=10)
+        self._exec = ThreadPoolExecutor(max_workers=1)
+
         # --- SPLIT AREA ---
         main_split = tk.PanedWindow(root, orient=tk.HORIZONTAL)
         main_split.pack(fill=tk.BOTH, expand=True)
@@ -135,6 +209,11 @@ class App:
         # Configure wrapper grid weight so self.right fills the space
         wrapper_right.grid_rowconfigure(0, weight=1)
         wrapper_right.grid_columnconfigure(0, weight=1)
+
+        # figure + canvas are created once; draw_plot only updates the bars
+        self._fig, self._ax, self._bars, self._annots = make_bar_plot()
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.right)
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # ------------------------------------------------------------------
         # --- MODIFICATIONS END HERE ---
@@ -147,8 +226,30 @@ class App:
 
         # --- TABLE SETUP ---
         # The table now needs to be packed into the self.left frame
-        self.table = ttk.Treeview(self.left)
-        self.table.pack(fill=tk.BOTH, expand=True)
+        # Only a window of TABLE_WINDOW rows lives in the Treeview; the
+        # scrollbar spans the whole file and the window is refilled on scroll.
+        table_box = tk.Frame(self.left)
+        table_box.pack(fill=tk.BOTH, expand=True)
+
+        self.table_scroll = ttk.Scrollbar(table_box, orient=tk.VERTICAL, command=self._on_scroll)
+        self.table_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table = ttk.Treeview(table_box, yscrollcommand=self._on_tree_scroll)
+        self.table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table.bind(seq, self._on_wheel)
+
+        # columns are fixed, so they are configured once here
+        self.table["columns"] = TABLE_COLUMNS
+        self.table["show"] = "headings"
+        for col in TABLE_COLUMNS:
+            self.table.heading(col, text=col)
+            self.table.column(col, width=180)
+
+        self._rows = []
+        self._n_rows = 0
+        self._win_start = 0
+        self._win_end = 0
 
         # Stats text under table
         # NOTE: You had two stats_label assignments here, fixed to use two labels for potential separate content
@@ -170,29 +271,131 @@ class App:
             self.process(path)
 
     def process(self, file):
+        keep = self.keep_seq_var.get()
         try:
-            df, stats = convert(file)
+            key = file_key(file) + (keep,)
+        except OSError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        self._request += 1
+        req = self._request
+
+        if key in self._cache:
+            data, stats, rows = self._cache.pop(key)
+            self._cache[key] = (data, stats, rows)  # mark as most recent
+            if key != self._csv_queued:
+                # project_output.csv is (or is about to be) another file's;
+                # rewrite it behind any parse still running
+                self._csv_queued = key
+                fut = self._exec.submit(save_csv, data)
+                fut.add_done_callback(lambda f: self.root.after(0, self._on_csv_saved, key, f))
+            self.show_result(data, stats, rows)
+            return
+
+        # convert() off the Tk thread, result handed back through after()
+        self._pending += 1
+        self._csv_queued = key  # convert() writes the CSV
+        self.progress.start(10)
+        fut = self._exec.submit(parse_for_table, file, keep)
+        fut.add_done_callback(lambda f: self.root.after(0, self._on_parsed, req, key, f))
+
+    def _on_csv_saved(self, key, fut):
+        if fut.exception() is None:
+            self._csv_key = key
+        elif self._csv_queued == key:
+            self._csv_queued = self._csv_key  # write failed; file still holds that one
+
+    def _on_parsed(self, req, key, fut):
+        self._pending -= 1
+        if not self._pending:
+            self.progress.stop()
+
+        stale = req != self._request  # user opened something else meanwhile
+        try:
+            data, stats, rows = fut.result()
         except Exception as e:
             traceback.print_exc()
-            messagebox.showerror("Error", str(e))
+            if self._csv_queued == key:
+                self._csv_queued = self._csv_key
+            if not stale:
+                messagebox.showerror("Error", str(e))
             return
 
-        self.load_table(df)
+        # convert() has written the CSV by the time its future completes
+        self._csv_key = key
+        self._cache[key] = (data, stats, rows)
+        while len(self._cache) > CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+        if not stale:
+            self.show_result(data, stats, rows)
+
+    def show_result(self, data, stats, rows):
+        self.load_table(rows)
         self.show_stats(stats)
         self.draw_plot(stats)
 
-    def load_table(self, df):
-        # Clear previous
+    def load_table(self, rows):
+        # _fill_window clears the (at most TABLE_WINDOW) previous rows
+        self._rows = rows
+        self._n_rows = len(rows)
+        self._fill_window(0)
+        self.table.yview_moveto(0)
+
+    def _fill_window(self, start):
+        """Replace the Treeview contents with rows [start, start + TABLE_WINDOW)."""
+        end = min(start + TABLE_WINDOW, self._n_rows)
         self.table.delete(*self.table.get_children())
-        self.table["columns"] = list(df.columns)
-        self.table["show"] = "headings"
 
-        for col in df.columns:
-            self.table.heading(col, text=col)
-            self.table.column(col, width=180)
+        # rows were built on the worker thread; only Tk inserts happen here
+        insert = self.table.insert
+        for row in self._rows[start:end]:
+            insert("", tk.END, values=row)
+
+        self._win_start, self._win_end = start, end
+
+    def _scroll_to(self, top):
+        """Show row `top` (index into the full table) at the top of the view."""
+        size = self._win_end - self._win_start
+        if not self._n_rows or not size:
+            return
+
+        lo, hi = self.table.yview()
+        visible = max(int(round((hi - lo) * size)), 1)
+        top = max(0, min(top, self._n_rows - visible))
 
-        for _, row in df.iterrows():
-            self.table.insert("", tk.END, values=list(row))
+        if not (self._win_start <= top and top + visible <= self._win_end):
+            self._fill_window(max(0, top - TABLE_WINDOW // 2))
+            size = self._win_end - self._win_start
+
+        self.table.yview_moveto((top - self._win_start) / size)
+
+    def _on_tree_scroll(self, lo, hi):
+        # map the Treeview's position inside the window onto the whole table
+        size = self._win_end - self._win_start
+        if not self._n_rows or not size:
+            self.table_scroll.set(0, 1)
+            return
+        n = self._n_rows
+        self.table_scroll.set((self._win_start + float(lo) * size) / n,
+                              (self._win_start + float(hi) * size) / n)
+
+    def _on_scroll(self, action, amount, unit=None):
+        lo, hi = self.table_scroll.get()
+        top = int(round(lo * self._n_rows))
+        if action == "moveto":
+            top = int(float(amount) * self._n_rows)
+        elif unit == "pages":
+            top += int(amount) * max(int((hi - lo) * self._n_rows), 1)
+        else:
+            top += int(amount)
+        self._scroll_to(top)
+
+    def _on_wheel(self, event):
+        step = -3 if (event.num == 4 or event.delta > 0) else 3
+        self._on_scroll("scroll", step, "units")
+        return "break"
 
     def show_stats(self, stats):
         txt = (
@@ -204,15 +407,18 @@ class App:
         self.stats_label_top.config(text=txt)
 
     def draw_plot(self, stats):
-        for w in self.right.winfo_children():
-            w.destroy()
-
-        fig = make_bar_plot(stats)
-        self.current_fig = fig
-
-        canvas = FigureCanvasTkAgg(fig, master=self.right)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        values = [stats["mean"], stats["median"], stats["mode"]]
+
+        for rect, ann, val in zip(self._bars, self._annots, values):
+            rect.set_height(val)
+            ann.set_text(f"{val:.2f}")
+            ann.xy = (rect.get_x() + rect.get_width() / 2, val)
+
+        self._ax.relim()
+        self._ax.autoscale_view()
+        self._fig.tight_layout()  # tick labels widen with the new y-range
+        self.current_fig = self._fig
+        self._canvas.draw_idle()
 
     def download_plot(self):
         if not self.current_fig:
@@ -0,0 +1,170 @@
+"""FASTA parsing and CSV helpers shared by code.py and code2.py (no Tk here)."""
+
+import csv
+import mmap
+import os
+from itertools import repeat
+
+import numpy as np
+
+try:  # optional: JIT for the length-only scan
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:  # optional: C-level CSV writer
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+PREVIEW_CHARS = 80     # Sequence cells are cut to this many chars
+
+
+def open_mmap(fasta_file):
+    """Read-only mmap of the file, or None if it is empty."""
+    with open(fasta_file, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def first_record(mm):
+    # offset of the first '>' that starts a line, or -1
+    if mm[:1] == b">":
+        return 0
+    pos = mm.find(b"\n>")
+    return pos + 1 if pos != -1 else -1
+
+
+def fasta_header_lengths(fasta_file):
+    """Yield (id, length) per record, never storing the sequence.
+
+    The file is mmap'd and split on newline-">" boundaries so the scan runs
+    in C (find/count) rather than one readline() per line.
+    """
+    mm = open_mmap(fasta_file)
+    if mm is None:
+        return
+    with mm:
+        size = len(mm)
+        start = first_record(mm)
+        while start != -1 and start < size:
+            nxt = mm.find(b"\n>", start)
+            end = size if nxt == -1 else nxt + 1
+            block = mm[start:end]
+
+            hdr_end = block.find(b"\n")
+            if hdr_end == -1:
+                hdr_end = len(block)
+            title = block[1:hdr_end].split(None, 1)
+            # same byte rules as _scan_fasta: newline, CR and space are not residues
+            length = (len(block) - hdr_end
+                      - block.count(b"\n", hdr_end) - block.count(b"\r", hdr_end)
+                      - block.count(b" ", hdr_end))
+
+            yield (title[0].decode() if title else ""), length
+            start = end
+
+
+def _scan_fasta(buf, starts, lengths):
+    """Byte scan of a FASTA buffer: header offsets into `starts`, residue
+    counts into `lengths`. Stops once `starts` is full; returns the number
+    of records stored."""
+    n = 0
+    cur_len = 0
+    at_line_start = True
+    in_header = False
+    for i in range(buf.shape[0]):
+        c = buf[i]
+        if at_line_start and c == 62:        # '>'
+            if n == starts.shape[0]:
+                break                        # more records than counted
+            if n > 0:
+                lengths[n - 1] = cur_len
+            starts[n] = i
+            n += 1
+            cur_len = 0
+            in_header = True
+        elif c == 10:                        # '\n'
+            in_header = False
+        elif n > 0 and not in_header and c != 13 and c != 32:
+            cur_len += 1
+        at_line_start = c == 10
+    if n > 0:
+        lengths[n - 1] = cur_len
+    return n
+
+
+# nogil: convert() runs on a worker thread and the Tk thread must keep running
+scan_fasta = njit(cache=True, nogil=True)(_scan_fasta) if njit is not None else None
+
+
+def jit_header_lengths(fasta_file, ids, L):
+    """Fill ids/L in place using the numba scan over the mmap'd bytes.
+    Returns the number of records actually filled."""
+    mm = open_mmap(fasta_file)
+    if mm is None:
+        return 0
+    with mm:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        starts = np.empty(len(L), dtype=np.int64)
+        try:
+            n = scan_fasta(buf, starts, L)
+        finally:
+            del buf  # release the buffer export so the mmap can close
+
+        for i, start in enumerate(starts[:n].tolist()):
+            end = mm.find(b"\n", start)
+            title = mm[start + 1:end if end != -1 else len(mm)].split(None, 1)
+            ids[i] = title[0].decode() if title else ""
+    return n
+
+
+def count_records(fasta_file):
+    """Cheap first pass: number of '>' header lines in the file."""
+    mm = open_mmap(fasta_file)
+    if mm is None:
+        return 0
+    with mm:
+        n = 0
+        pos = first_record(mm)
+        while pos != -1:
+            n += 1
+            pos = mm.find(b"\n>", pos)
+            if pos != -1:
+                pos += 1
+        return n
+
+
+def save_csv(columns, path="project_output.csv"):
+    """Write a dict of columns as CSV with the same bytes DataFrame.to_csv gave:
+    quotes only where a cell needs them, "\n" line ends. pyarrow does the bulk
+    write when installed, otherwise the csv module."""
+    if pa is not None:
+        try:
+            with open(path, "wb") as fh:
+                # arrow always quotes its header, so write that line ourselves
+                fh.write((",".join(columns) + "\n").encode())
+                pacsv.write_csv(pa.table(columns), fh,
+                                write_options=pacsv.WriteOptions(include_header=False,
+                                                                 quoting_style="none"))
+            return
+        except pa.ArrowInvalid:
+            pass  # some cell needs quoting; "needed" would quote every string
+
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(zip(*columns.values()))
+
+
+def preview_rows(data):
+    """Treeview-ready (Id, Sequence, Length) tuples; Sequence cut to
+    PREVIEW_CHARS, or "(hidden)" when convert() dropped the sequences."""
+    if "Sequence" in data:
+        seqs = [s[:PREVIEW_CHARS] for s in data["Sequence"]]
+    else:
+        seqs = repeat("(hidden)")
+    return list(zip(data["Id"], seqs, data["Length"].tolist()))